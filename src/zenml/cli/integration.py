@@ -269,7 +269,7 @@ def install(
                     "There is a known issue with Label Studio installations "
                     "via zenml. You might find that the Label Studio "
                     "installation breaks the ZenML CLI. In this case, "
-                    "please run `pip install 'pydantic<1.11,>=1.9.0'` to "
+                    "please run `pip install 'pydantic<1.11,>=1.10.0'` to "
                     "fix the issue or message us on Slack if you need help "
                     "with this. We are working on a more definitive fix."
                 )
@@ -402,7 +402,7 @@ def upgrade(
                     "There is a known issue with Label Studio installations "
                     "via zenml. You might find that the Label Studio "
                     "installation breaks the ZenML CLI. In this case, please "
-                    "run `pip install 'pydantic<1.11,>=1.9.0'` to fix the "
+                    "run `pip install 'pydantic<1.11,>=1.10.0'` to fix the "
                     "issue or message us on Slack if you need help with this. "
                     "We are working on a more definitive fix."
                 )
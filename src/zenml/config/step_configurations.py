@@ -48,6 +48,16 @@ class PartialArtifactConfiguration(StrictBaseModel):
     # for all steps/outputs
     default_materializer_source: Optional[Source] = None
 
+    class Config:
+        """Pydantic config class."""
+
+        # Attribute assignment is disabled and configurations only get
+        # updated by creating copies, so instances can be shared instead of
+        # copied when they are validated as a field value of another model.
+        # The string value requires pydantic>=1.10, older versions expect a
+        # boolean here.
+        copy_on_model_validation = "none"
+
     @root_validator(pre=True)
     def _remove_deprecated_attributes(
         cls, values: Dict[str, Any]
@@ -141,6 +151,12 @@ class StepConfigurationUpdate(StrictBaseModel):
         "name"
     )
 
+    class Config:
+        """Pydantic config class."""
+
+        # See `PartialArtifactConfiguration.Config`
+        copy_on_model_validation = "none"
+
 
 class PartialStepConfiguration(StepConfigurationUpdate):
     """Class representing a partial step configuration."""
@@ -44,6 +44,3 @@ class AirflowIntegration(Integration):
         )
 
         return [AirflowOrchestratorFlavor]
-
-
-AirflowIntegration.check_installation()
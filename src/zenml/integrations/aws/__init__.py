@@ -64,6 +64,3 @@ class AWSIntegration(Integration):
             SagemakerStepOperatorFlavor,
             SagemakerOrchestratorFlavor,
         ]
-
-
-AWSIntegration.check_installation()
@@ -67,6 +67,3 @@ class AzureIntegration(Integration):
             AzureSecretsManagerFlavor,
             AzureMLStepOperatorFlavor,
         ]
-
-
-AzureIntegration.check_installation()
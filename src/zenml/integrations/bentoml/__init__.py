@@ -52,6 +52,3 @@ class BentoMLIntegration(Integration):
         )
 
         return [BentoMLModelDeployerFlavor]
-
-
-BentoMLIntegration.check_installation()
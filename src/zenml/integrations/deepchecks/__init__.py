@@ -61,6 +61,3 @@ class DeepchecksIntegration(Integration):
         )
 
         return [DeepchecksDataValidatorFlavor]
-
-
-DeepchecksIntegration.check_installation()
@@ -68,6 +68,3 @@ class EvidentlyIntegration(Integration):
         )
 
         return [EvidentlyDataValidatorFlavor]
-
-
-EvidentlyIntegration.check_installation()
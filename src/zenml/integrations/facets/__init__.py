@@ -27,6 +27,3 @@ class FacetsIntegration(Integration):
     def activate() -> None:
         """Activate the Facets integration."""
         from zenml.integrations.facets import materializers  # noqa
-
-
-FacetsIntegration.check_installation()
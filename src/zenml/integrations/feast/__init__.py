@@ -43,6 +43,3 @@ class FeastIntegration(Integration):
         from zenml.integrations.feast.flavors import FeastFeatureStoreFlavor
 
         return [FeastFeatureStoreFlavor]
-
-
-FeastIntegration.check_installation()
@@ -23,6 +23,3 @@ class GitHubIntegration(Integration):
 
     NAME = GITHUB
     REQUIREMENTS: List[str] = ["pygithub"]
-
-
-GitHubIntegration.check_installation()
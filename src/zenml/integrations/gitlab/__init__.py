@@ -23,6 +23,3 @@ class GitLabIntegration(Integration):
 
     NAME = GITLAB
     REQUIREMENTS: List[str] = ["python-gitlab"]
-
-
-GitLabIntegration.check_installation()
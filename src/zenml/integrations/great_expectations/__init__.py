@@ -54,6 +54,3 @@ class GreatExpectationsIntegration(Integration):
         )
 
         return [GreatExpectationsDataValidatorFlavor]
-
-
-GreatExpectationsIntegration.check_installation()
@@ -37,6 +37,3 @@ class KanikoIntegration(Integration):
         from zenml.integrations.kaniko.flavors import KanikoImageBuilderFlavor
 
         return [KanikoImageBuilderFlavor]
-
-
-KanikoIntegration.check_installation()
@@ -52,6 +52,3 @@ class KServeIntegration(Integration):
         from zenml.integrations.kserve.flavors import KServeModelDeployerFlavor
 
         return [KServeModelDeployerFlavor]
-
-
-KServeIntegration.check_installation()
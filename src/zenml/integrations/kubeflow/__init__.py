@@ -44,6 +44,3 @@ class KubeflowIntegration(Integration):
         )
 
         return [KubeflowOrchestratorFlavor]
-
-
-KubeflowIntegration.check_installation()
@@ -44,6 +44,3 @@ class KubernetesIntegration(Integration):
         )
 
         return [KubernetesOrchestratorFlavor]
-
-
-KubernetesIntegration.check_installation()
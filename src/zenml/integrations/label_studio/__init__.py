@@ -43,6 +43,3 @@ class LabelStudioIntegration(Integration):
         )
 
         return [LabelStudioAnnotatorFlavor]
-
-
-LabelStudioIntegration.check_installation()
@@ -15,10 +15,9 @@
 
 from zenml.integrations.constants import LANGCHAIN
 from zenml.integrations.integration import Integration
+from zenml.logger import LazyLogger
 
-from zenml.logger import get_logger
-
-logger = get_logger(__name__)
+logger = LazyLogger(__name__)
 
 
 class LangchainIntegration(Integration):
@@ -31,6 +30,3 @@ class LangchainIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.langchain import materializers  # noqa
-
-
-LangchainIntegration.check_installation()
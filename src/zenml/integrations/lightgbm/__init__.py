@@ -27,6 +27,3 @@ class LightGBMIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.lightgbm import materializers  # noqa
-
-
-LightGBMIntegration.check_installation()
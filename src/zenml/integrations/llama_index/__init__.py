@@ -12,13 +12,11 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Initialization of the Llama Index integration."""
-from zenml.integrations.integration import Integration
-
-from zenml.logger import get_logger
 from zenml.integrations.constants import LLAMA_INDEX
 from zenml.integrations.integration import Integration
+from zenml.logger import LazyLogger
 
-logger = get_logger(__name__)
+logger = LazyLogger(__name__)
 
 
 class LlamaIndexIntegration(Integration):
@@ -31,6 +29,3 @@ class LlamaIndexIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.llama_index import materializers  # noqa
-
-
-LlamaIndexIntegration.check_installation()
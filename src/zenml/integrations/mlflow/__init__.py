@@ -63,6 +63,3 @@ class MlflowIntegration(Integration):
             MLFlowExperimentTrackerFlavor,
             MLFlowModelRegistryFlavor,
         ]
-
-
-MlflowIntegration.check_installation()
@@ -47,6 +47,3 @@ class NeptuneIntegration(Integration):
         return [
             NeptuneExperimentTrackerFlavor,
         ]
-
-
-NeptuneIntegration.check_installation()  # this checks if the requirements are installed
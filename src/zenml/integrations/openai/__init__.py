@@ -22,6 +22,3 @@ class OpenAIIntegration(Integration):
 
     NAME = OPEN_AI
     REQUIREMENTS = ["openai>=0.27.0"]
-
-
-OpenAIIntegration.check_installation()
@@ -33,6 +33,3 @@ class PyCaretIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.pycaret import materializers  # noqa
-
-
-PyCaretIntegration.check_installation()
@@ -53,6 +53,3 @@ class S3Integration(Integration):
         from zenml.integrations.s3.flavors import S3ArtifactStoreFlavor
 
         return [S3ArtifactStoreFlavor]
-
-
-S3Integration.check_installation()
@@ -27,6 +27,3 @@ class ScipyIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.scipy import materializers  # noqa
-
-
-ScipyIntegration.check_installation()
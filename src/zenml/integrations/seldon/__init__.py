@@ -50,6 +50,3 @@ class SeldonIntegration(Integration):
         from zenml.integrations.seldon.flavors import SeldonModelDeployerFlavor
 
         return [SeldonModelDeployerFlavor]
-
-
-SeldonIntegration.check_installation()
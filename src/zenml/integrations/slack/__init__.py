@@ -42,6 +42,3 @@ class SlackIntegration(Integration):
         from zenml.integrations.slack.flavors import SlackAlerterFlavor
 
         return [SlackAlerterFlavor]
-
-
-SlackIntegration.check_installation()
@@ -47,6 +47,3 @@ class SparkIntegration(Integration):
         )
 
         return [KubernetesSparkStepOperatorFlavor]
-
-
-SparkIntegration.check_installation()
@@ -43,6 +43,3 @@ class TektonIntegration(Integration):
         from zenml.integrations.tekton.flavors import TektonOrchestratorFlavor
 
         return [TektonOrchestratorFlavor]
-
-
-TektonIntegration.check_installation()
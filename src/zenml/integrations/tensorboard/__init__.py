@@ -53,6 +53,3 @@ class TensorBoardIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.tensorboard import services  # noqa
-
-
-TensorBoardIntegration.check_installation()
@@ -43,6 +43,3 @@ class VaultSecretsManagerIntegration(Integration):
         from zenml.integrations.vault.flavors import VaultSecretsManagerFlavor
 
         return [VaultSecretsManagerFlavor]
-
-
-VaultSecretsManagerIntegration.check_installation()
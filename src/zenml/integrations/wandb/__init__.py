@@ -44,6 +44,3 @@ class WandbIntegration(Integration):
         )
 
         return [WandbExperimentTrackerFlavor]
-
-
-WandbIntegration.check_installation()
@@ -47,6 +47,3 @@ class WhylogsIntegration(Integration):
         )
 
         return [WhylogsDataValidatorFlavor]
-
-
-WhylogsIntegration.check_installation()
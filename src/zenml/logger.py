@@ -17,7 +17,7 @@ import logging
 import os
 import re
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from rich.traceback import install as rich_tb_install
 
@@ -148,6 +148,38 @@ def get_logger(logger_name: str) -> logging.Logger:
     return logger
 
 
+class LazyLogger:
+    """Logger proxy that only initializes the underlying logger when used.
+
+    Calling `get_logger(...)` attaches a new console handler to the logger,
+    which is wasted work for modules that are imported but never log
+    anything. This proxy defers the `get_logger(...)` call until the first
+    attribute of the logger is accessed.
+    """
+
+    def __init__(self, logger_name: str) -> None:
+        """Initializes the lazy logger.
+
+        Args:
+            logger_name: Name of the logger to initialize on first use.
+        """
+        self._logger_name = logger_name
+        self._logger: Optional[logging.Logger] = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Forwards attribute access to the underlying logger.
+
+        Args:
+            name: Name of the attribute.
+
+        Returns:
+            The attribute of the underlying logger.
+        """
+        if self._logger is None:
+            self._logger = get_logger(self._logger_name)
+        return getattr(self._logger, name)
+
+
 def init_logging() -> None:
     """Initialize logging with default levels."""
     # Mute tensorflow cuda warnings
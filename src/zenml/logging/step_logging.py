@@ -15,6 +15,7 @@
 import os
 import re
 import sys
+import threading
 import time
 from contextvars import ContextVar
 from types import TracebackType
@@ -34,6 +35,8 @@ logger = get_logger(__name__)
 
 redirected: ContextVar[bool] = ContextVar("redirected", default=False)
 
+ANSI_ESCAPE_CODE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 def remove_ansi_escape_codes(text: str) -> str:
     """Auxiliary function to remove ANSI escape codes from a given string.
@@ -44,8 +47,7 @@ def remove_ansi_escape_codes(text: str) -> str:
     Returns:
         the version of the input string where the escape codes are removed.
     """
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return ANSI_ESCAPE_CODE_PATTERN.sub("", text)
 
 
 def prepare_logs_uri(
@@ -110,9 +112,21 @@ class StepLogsStorage:
 
         # State
         self.buffer: List[str] = []
-        self.disabled_buffer: List[str] = []
-        self.last_save_time = time.time()
-        self.disabled = False
+        self._buffer_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self.last_save_time = time.monotonic()
+        # Messages written by a thread while it is saving the buffer (e.g.
+        # the error log below) are discarded to avoid recursion
+        self._thread_state = threading.local()
+
+    @property
+    def _is_saving(self) -> bool:
+        """Whether the current thread is saving the buffer.
+
+        Returns:
+            True if the current thread is saving the buffer, False otherwise.
+        """
+        return getattr(self._thread_state, "saving", False)
 
     def write(self, text: str) -> None:
         """Main write method.
@@ -120,42 +134,59 @@ class StepLogsStorage:
         Args:
             text: the incoming string.
         """
-        if text == "\n":
+        if text == "\n" or self._is_saving:
             return
 
-        if not self.disabled:
+        with self._buffer_lock:
             self.buffer.append(text)
-
-            if (
+            save_required = (
                 len(self.buffer) >= self.max_messages
-                or time.time() - self.last_save_time >= self.time_interval
-            ):
-                self.save_to_file()
-
-    def save_to_file(self) -> None:
-        """Method to save the buffer to the given URI."""
-        if not self.disabled:
-            try:
-                self.disabled = True
-
-                if self.buffer:
-                    with fileio.open(self.logs_uri, "a") as file:
-                        for message in self.buffer:
-                            file.write(
-                                remove_ansi_escape_codes(message) + "\n"
-                            )
-
-            except (OSError, IOError) as e:
-                # This exception can be raised if there are issues with the
-                # underlying system calls, such as reaching the maximum number
-                # of open files, permission issues, file corruption, or other
-                # I/O errors.
-                logger.error(f"Error while trying to write logs: {e}")
-            finally:
-                self.buffer = []
-                self.last_save_time = time.time()
-
-                self.disabled = False
+                or time.monotonic() - self.last_save_time >= self.time_interval
+            )
+
+        if save_required:
+            # If another thread is currently saving, the messages will be
+            # picked up by the next save
+            self.save_to_file(blocking=False)
+
+    def save_to_file(self, blocking: bool = True) -> None:
+        """Method to save the buffer to the given URI.
+
+        Args:
+            blocking: If `False`, the buffer will not be saved if another
+                thread is already saving.
+        """
+        if self._is_saving:
+            return
+
+        if not self._save_lock.acquire(blocking=blocking):
+            return
+
+        try:
+            with self._buffer_lock:
+                buffer, self.buffer = self.buffer, []
+                self.last_save_time = time.monotonic()
+
+            if buffer:
+                self._thread_state.saving = True
+                # Write the whole buffer at once, as each write might result
+                # in a separate request for remote artifact stores
+                logs = "".join(
+                    remove_ansi_escape_codes(message) + "\n"
+                    for message in buffer
+                )
+                with fileio.open(self.logs_uri, "a") as file:
+                    file.write(logs)
+
+        except (OSError, IOError) as e:
+            # This exception can be raised if there are issues with the
+            # underlying system calls, such as reaching the maximum number
+            # of open files, permission issues, file corruption, or other
+            # I/O errors.
+            logger.error(f"Error while trying to write logs: {e}")
+        finally:
+            self._thread_state.saving = False
+            self._save_lock.release()
 
 
 class StepLogsStorageContext:
@@ -248,7 +279,7 @@ class StepLogsStorageContext:
 
         def wrapped_flush(*args: Any, **kwargs: Any) -> Any:
             output = method(*args, **kwargs)
-            self.storage.save_to_file()
+            self.storage.save_to_file(blocking=False)
             return output
 
         return wrapped_flush
@@ -49,10 +49,7 @@ from zenml.orchestrators.publish_utils import (
 )
 from zenml.orchestrators.utils import is_setting_enabled
 from zenml.steps.step_environment import StepEnvironment
-from zenml.steps.utils import (
-    parse_return_type_annotations,
-    resolve_type_annotation,
-)
+from zenml.steps.utils import resolve_type_annotation
 from zenml.utils import artifact_utils, materializer_utils, source_utils
 
 if TYPE_CHECKING:
@@ -219,11 +216,9 @@ class StepRunner:
                             )
 
                         # Store and publish the output artifacts of the step function.
-                        output_annotations = parse_return_type_annotations(
-                            func=step_instance.entrypoint
-                        )
                         output_data = self._validate_outputs(
-                            return_values, output_annotations
+                            return_values,
+                            step_instance.entrypoint_definition.outputs,
                         )
                         artifact_metadata_enabled = is_setting_enabled(
                             is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
@@ -59,6 +59,8 @@ class BasePipeline(Pipeline, ABC):
     """Legacy pipeline class."""
 
     _CLASS_CONFIGURATION: ClassVar[Optional[Dict[str, Any]]] = None
+    # Signature of the `connect` method, computed once per pipeline class
+    _CONNECT_SIGNATURE: ClassVar[Optional[inspect.Signature]] = None
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initializes a pipeline.
@@ -232,7 +234,13 @@ class BasePipeline(Pipeline, ABC):
         Returns:
             The verified steps.
         """
-        signature = inspect.signature(self.connect, follow_wrapped=True)
+        pipeline_class = self.__class__
+        # Only use a signature stored on this exact class, subclasses might
+        # override the `connect` method
+        signature = pipeline_class.__dict__.get("_CONNECT_SIGNATURE")
+        if signature is None:
+            signature = inspect.signature(self.connect, follow_wrapped=True)
+            pipeline_class._CONNECT_SIGNATURE = signature
 
         try:
             bound_args = signature.bind(*args, **kwargs)
@@ -13,15 +13,19 @@
 #  permissions and limitations under the License.
 """Base Step for ZenML."""
 import copy
+import functools
 import hashlib
 import inspect
+import logging
 from abc import abstractmethod
 from collections import defaultdict
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Dict,
+    FrozenSet,
     Mapping,
     Optional,
     Sequence,
@@ -35,9 +39,11 @@ from typing import (
 from uuid import UUID
 
 from pydantic import BaseModel, Extra, ValidationError
+from pydantic.typing import get_origin, is_none_type, is_union
 
 from zenml.config.source import Source
 from zenml.config.step_configurations import (
+    ArtifactConfiguration,
     PartialArtifactConfiguration,
     PartialStepConfiguration,
     StepConfiguration,
@@ -50,16 +56,19 @@ from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.materializers.materializer_registry import materializer_registry
 from zenml.steps.base_parameters import BaseParameters
 from zenml.steps.entrypoint_function_utils import (
+    EntrypointFunctionDefinition,
     StepArtifact,
     get_step_entrypoint_signature,
     validate_entrypoint_function,
+    validate_reserved_arguments,
 )
 from zenml.steps.external_artifact import ExternalArtifact
 from zenml.steps.utils import (
+    get_args,
+    is_subclass_annotation,
     resolve_type_annotation,
 )
 from zenml.utils import (
-    dict_utils,
     pydantic_utils,
     settings_utils,
     source_code_utils,
@@ -104,17 +113,118 @@ class BaseStepMeta(type):
         """
         cls = cast(Type["BaseStep"], super().__new__(mcs, name, bases, dct))
         if name not in {"BaseStep", "_DecoratedStep"}:
-            validate_entrypoint_function(cls.entrypoint)
+            # The entrypoint definition and signature only depend on the
+            # class, store them so step instances don't need to inspect the
+            # entrypoint again
+            entrypoint_definition = validate_entrypoint_function(
+                cls.entrypoint
+            )
+            cls._ENTRYPOINT_DEFINITION = entrypoint_definition
+            cls._ENTRYPOINT_SIGNATURE = get_step_entrypoint_signature(cls)
+            cls._ALLOWED_OUTPUT_NAMES = frozenset(
+                entrypoint_definition.outputs
+            )
 
         return cls
 
 
+@functools.lru_cache(maxsize=512)
+def _source_from_import_path(import_path: str) -> Source:
+    """Creates a source from an import path.
+
+    Args:
+        import_path: The import path.
+
+    Returns:
+        The source.
+    """
+    return Source.from_import_path(import_path)
+
+
+def _resolve_if_necessary(value: Union[str, Source, Type[Any]]) -> Source:
+    """Resolves a materializer source if necessary.
+
+    Args:
+        value: The import path, source or class of the materializer.
+
+    Returns:
+        The materializer source.
+    """
+    if isinstance(value, str):
+        return _source_from_import_path(value)
+    elif isinstance(value, Source):
+        return value
+    else:
+        return source_utils.resolve(value)
+
+
+def _convert_to_tuple(value: Any) -> Tuple[Source, ...]:
+    """Converts one or multiple materializers to a tuple of sources.
+
+    Args:
+        value: The materializer(s) to convert.
+
+    Returns:
+        The materializer sources.
+    """
+    if isinstance(value, str) or not isinstance(value, Sequence):
+        return (_resolve_if_necessary(value),)
+    else:
+        return tuple(_resolve_if_necessary(v) for v in value)
+
+
+def _get_output_types(output_annotation: Any) -> Tuple[Type[Any], ...]:
+    """Gets the types that a step output annotation can hold.
+
+    Args:
+        output_annotation: The output annotation.
+
+    Returns:
+        The members of the annotation if it is a union, otherwise a tuple
+        containing only the annotation itself.
+    """
+    if is_union(get_origin(output_annotation) or output_annotation):
+        return tuple(
+            type(None) if is_none_type(output_type) else output_type
+            for output_type in get_args(output_annotation)
+        )
+    else:
+        return (output_annotation,)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_parameter_fields(
+    parameters_class: Type[BaseParameters],
+) -> Tuple[Tuple[str, bool, Any], ...]:
+    """Gets the fields of a legacy parameters class.
+
+    Args:
+        parameters_class: The parameters class.
+
+    Returns:
+        Tuples containing the name of each field, whether it is required and
+        its default value.
+    """
+    return tuple(
+        (name, field.required, field.default)
+        for name, field in parameters_class.__fields__.items()
+    )
+
+
 T = TypeVar("T", bound="BaseStep")
 
 
 class BaseStep(metaclass=BaseStepMeta):
     """Abstract base class for all ZenML steps."""
 
+    # Entrypoint definition, signature and allowed output names, computed once
+    # per step class by the metaclass
+    _ENTRYPOINT_DEFINITION: ClassVar[
+        Optional[EntrypointFunctionDefinition]
+    ] = None
+    _ENTRYPOINT_SIGNATURE: ClassVar[Optional[inspect.Signature]] = None
+    _ALLOWED_OUTPUT_NAMES: ClassVar[Optional[FrozenSet[str]]] = None
+
     def __init__(
         self,
         *args: Any,
@@ -164,8 +274,18 @@ class BaseStep(metaclass=BaseStepMeta):
             **kwargs: Keyword arguments passed to the step.
         """
         self._upstream_steps: Set["BaseStep"] = set()
-        self.entrypoint_definition = validate_entrypoint_function(
-            self.entrypoint, reserved_arguments=["after", "id"]
+        self._caching_parameters: Optional[Dict[str, Any]] = None
+        entrypoint_definition = self._ENTRYPOINT_DEFINITION
+        if entrypoint_definition is None:
+            entrypoint_definition = validate_entrypoint_function(
+                self.entrypoint
+            )
+        validate_reserved_arguments(
+            signature=self._get_entrypoint_signature(),
+            reserved_arguments=["after", "id"],
+        )
+        self.entrypoint_definition: EntrypointFunctionDefinition = (
+            entrypoint_definition
         )
 
         name = name or self.__class__.__name__
@@ -183,29 +303,20 @@ class BaseStep(metaclass=BaseStepMeta):
                     name,
                 )
 
-        logger.debug(
-            "Step '%s': Caching %s.",
-            name,
-            "enabled" if enable_cache is not False else "disabled",
-        )
-        logger.debug(
-            "Step '%s': Artifact metadata %s.",
-            name,
-            "enabled" if enable_artifact_metadata is not False else "disabled",
-        )
-        logger.debug(
-            "Step '%s': Artifact visualization %s.",
-            name,
-            "enabled"
-            if enable_artifact_visualization is not False
-            else "disabled",
-        )
-
-        logger.debug(
-            "Step '%s': logs %s.",
-            name,
-            "enabled" if enable_step_logs is not False else "disabled",
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Step '%s': Caching %s, artifact metadata %s, artifact "
+                "visualization %s, logs %s.",
+                name,
+                "enabled" if enable_cache is not False else "disabled",
+                "enabled"
+                if enable_artifact_metadata is not False
+                else "disabled",
+                "enabled"
+                if enable_artifact_visualization is not False
+                else "disabled",
+                "enabled" if enable_step_logs is not False else "disabled",
+            )
 
         self._configuration = PartialStepConfiguration(
             name=name,
@@ -270,13 +381,15 @@ class BaseStep(metaclass=BaseStepMeta):
 
     @property
     def upstream_steps(self) -> Set["BaseStep"]:
-        """Names of the upstream steps of this step.
+        """Upstream steps of this step.
 
         This property will only contain the full set of upstream steps once
-        it's parent pipeline `connect(...)` method was called.
+        it's parent pipeline `connect(...)` method was called. The step
+        instances get mapped to their invocation IDs when the pipeline is
+        compiled.
 
         Returns:
-            Set of upstream step names.
+            Set of upstream step instances.
         """
         return self._upstream_steps
 
@@ -338,6 +451,21 @@ class BaseStep(metaclass=BaseStepMeta):
     def caching_parameters(self) -> Dict[str, Any]:
         """Caching parameters for this step.
 
+        The parameters only depend on the step source and the configured
+        output materializers, so they get computed once and cached until the
+        output configuration changes.
+
+        Returns:
+            A dictionary containing the caching parameters
+        """
+        if self._caching_parameters is None:
+            self._caching_parameters = self._compute_caching_parameters()
+
+        return self._caching_parameters.copy()
+
+    def _compute_caching_parameters(self) -> Dict[str, Any]:
+        """Computes the caching parameters for this step.
+
         Returns:
             A dictionary containing the caching parameters
         """
@@ -377,9 +505,8 @@ class BaseStep(metaclass=BaseStepMeta):
             StepInterfaceError: If there are too many arguments or arguments
                 with a wrong name/type.
         """
-        maximum_arg_count = (
-            1 if self.entrypoint_definition.legacy_params else 0
-        )
+        legacy_params = self.entrypoint_definition.legacy_params
+        maximum_arg_count = 1 if legacy_params else 0
         arg_count = len(args) + len(kwargs)
         if arg_count > maximum_arg_count:
             raise StepInterfaceError(
@@ -388,18 +515,17 @@ class BaseStep(metaclass=BaseStepMeta):
                 f"'{self.name}' step."
             )
 
-        if self.entrypoint_definition.legacy_params:
+        if legacy_params:
             if args:
                 config = args[0]
             elif kwargs:
                 key, config = kwargs.popitem()
 
-                if key != self.entrypoint_definition.legacy_params.name:
+                if key != legacy_params.name:
                     raise StepInterfaceError(
                         f"Unknown keyword argument '{key}' when creating a "
                         f"'{self.name}' step, only expected a single "
-                        "argument with key "
-                        f"'{self.entrypoint_definition.legacy_params.name}'."
+                        f"argument with key '{legacy_params.name}'."
                     )
             else:
                 # This step requires configuration parameters but no parameters
@@ -409,18 +535,27 @@ class BaseStep(metaclass=BaseStepMeta):
                 # that all parameters are set before running the step
                 return
 
-            if not isinstance(
-                config, self.entrypoint_definition.legacy_params.annotation
-            ):
+            if not isinstance(config, legacy_params.annotation):
                 raise StepInterfaceError(
                     f"`{config}` object passed when creating a "
                     f"'{self.name}' step is not a "
-                    f"`{self.entrypoint_definition.legacy_params.annotation.__name__} "
-                    "` instance."
+                    f"`{legacy_params.annotation.__name__} ` instance."
                 )
 
             self.configure(parameters=config)
 
+    def _get_entrypoint_signature(self) -> inspect.Signature:
+        """Gets the entrypoint signature of this step.
+
+        Returns:
+            The entrypoint function signature.
+        """
+        signature = self._ENTRYPOINT_SIGNATURE
+        if signature is None:
+            signature = get_step_entrypoint_signature(self.__class__)
+
+        return signature
+
     def _parse_call_args(
         self, *args: Any, **kwargs: Any
     ) -> Tuple[
@@ -440,7 +575,7 @@ class BaseStep(metaclass=BaseStepMeta):
         Returns:
             The artifacts, external artifacts and parameters for the step.
         """
-        signature = get_step_entrypoint_signature(step=self)
+        signature = self._get_entrypoint_signature()
 
         try:
             bound_args = signature.bind_partial(*args, **kwargs)
@@ -479,20 +614,23 @@ class BaseStep(metaclass=BaseStepMeta):
                 parameters[key] = value
 
         # Above we iterated over the provided arguments which should overwrite
-        # any parameters previously defined on the step instance. Now we apply
-        # the default values on the entrypoint function and add those as
-        # parameters for any argument that has no value yet. If we were to do
-        # that in the above loop, we would overwrite previously configured
-        # parameters with the default values.
-        bound_args.apply_defaults()
-        for key, value in bound_args.arguments.items():
-            self.entrypoint_definition.validate_input(key=key, value=value)
+        # any parameters previously defined on the step instance. Now we add
+        # the default values of the entrypoint function as parameters for any
+        # argument that has no value yet. If we were to do that in the above
+        # loop, we would overwrite previously configured parameters with the
+        # default values.
+        for key, parameter in signature.parameters.items():
             if (
-                key not in artifacts
-                and key not in external_artifacts
-                and key not in self.configuration.parameters
+                parameter.default is parameter.empty
+                or key in bound_args.arguments
             ):
-                parameters[key] = value
+                continue
+
+            self.entrypoint_definition.validate_input(
+                key=key, value=parameter.default
+            )
+            if key not in self.configuration.parameters:
+                parameters[key] = parameter.default
 
         return artifacts, external_artifacts, parameters
 
@@ -535,10 +673,10 @@ class BaseStep(metaclass=BaseStepMeta):
         upstream_steps = {
             artifact.invocation_id for artifact in input_artifacts.values()
         }
-        if isinstance(after, str):
-            upstream_steps.add(after)
-        elif isinstance(after, Sequence):
-            upstream_steps = upstream_steps.union(after)
+        if after:
+            upstream_steps.update(
+                (after,) if isinstance(after, str) else after
+            )
 
         invocation_id = Pipeline.ACTIVE_PIPELINE.add_step_invocation(
             step=self,
@@ -550,15 +688,15 @@ class BaseStep(metaclass=BaseStepMeta):
             allow_id_suffix=not id,
         )
 
-        outputs = []
-        for key, annotation in self.entrypoint_definition.outputs.items():
-            output = StepArtifact(
+        outputs = [
+            StepArtifact(
                 invocation_id=invocation_id,
                 output_name=key,
                 annotation=annotation,
                 pipeline=Pipeline.ACTIVE_PIPELINE,
             )
-            outputs.append(output)
+            for key, annotation in self.entrypoint_definition.outputs.items()
+        ]
         return outputs[0] if len(outputs) == 1 else outputs
 
     def call_entrypoint(self, *args: Any, **kwargs: Any) -> Any:
@@ -682,36 +820,18 @@ class BaseStep(metaclass=BaseStepMeta):
         if name:
             logger.warning("Configuring the name of a step is deprecated.")
 
-        def _resolve_if_necessary(
-            value: Union[str, Source, Type[Any]]
-        ) -> Source:
-            if isinstance(value, str):
-                return Source.from_import_path(value)
-            elif isinstance(value, Source):
-                return value
-            else:
-                return source_utils.resolve(value)
-
-        def _convert_to_tuple(value: Any) -> Tuple[Source, ...]:
-            if isinstance(value, str) or not isinstance(value, Sequence):
-                return (_resolve_if_necessary(value),)
-            else:
-                return tuple(_resolve_if_necessary(v) for v in value)
-
-        outputs: Dict[str, Dict[str, Tuple[Source, ...]]] = defaultdict(dict)
-        allowed_output_names = set(self.entrypoint_definition.outputs)
+        outputs: Dict[str, Dict[str, Tuple[Source, ...]]] = {}
 
         if output_materializers:
-            if not isinstance(output_materializers, Mapping):
+            if isinstance(output_materializers, Mapping):
+                for output_name, materializer in output_materializers.items():
+                    outputs[output_name] = {
+                        "materializer_source": _convert_to_tuple(materializer)
+                    }
+            else:
                 sources = _convert_to_tuple(output_materializers)
-                output_materializers = {
-                    output_name: sources
-                    for output_name in allowed_output_names
-                }
-
-            for output_name, materializer in output_materializers.items():
-                sources = _convert_to_tuple(materializer)
-                outputs[output_name]["materializer_source"] = sources
+                for output_name in self.entrypoint_definition.outputs:
+                    outputs[output_name] = {"materializer_source": sources}
 
         failure_hook_source = None
         if on_failure:
@@ -726,22 +846,27 @@ class BaseStep(metaclass=BaseStepMeta):
         if isinstance(parameters, BaseParameters):
             parameters = parameters.dict()
 
-        values = dict_utils.remove_none_values(
-            {
-                "enable_cache": enable_cache,
-                "enable_artifact_metadata": enable_artifact_metadata,
-                "enable_artifact_visualization": enable_artifact_visualization,
-                "enable_step_logs": enable_step_logs,
-                "experiment_tracker": experiment_tracker,
-                "step_operator": step_operator,
-                "parameters": parameters,
-                "settings": settings,
-                "outputs": outputs or None,
-                "extra": extra,
-                "failure_hook_source": failure_hook_source,
-                "success_hook_source": success_hook_source,
-            }
-        )
+        values = {
+            key: value
+            for key, value in (
+                ("enable_cache", enable_cache),
+                ("enable_artifact_metadata", enable_artifact_metadata),
+                (
+                    "enable_artifact_visualization",
+                    enable_artifact_visualization,
+                ),
+                ("enable_step_logs", enable_step_logs),
+                ("experiment_tracker", experiment_tracker),
+                ("step_operator", step_operator),
+                ("parameters", parameters),
+                ("settings", settings),
+                ("outputs", outputs or None),
+                ("extra", extra),
+                ("failure_hook_source", failure_hook_source),
+                ("success_hook_source", success_hook_source),
+            )
+            if value is not None
+        }
         config = StepConfigurationUpdate(**values)
         self._apply_configuration(config, merge=merge)
         return self
@@ -821,7 +946,12 @@ class BaseStep(metaclass=BaseStepMeta):
         Returns:
             The step copy.
         """
-        return copy.deepcopy(self)
+        step_copy = copy.deepcopy(self)
+        # The source code of the step or its materializers might have been
+        # replaced in the meantime (e.g. by IPython autoreload), so the
+        # caching parameters need to be computed again for the copy
+        step_copy._caching_parameters = None
+        return step_copy
 
     def _apply_configuration(
         self,
@@ -841,9 +971,13 @@ class BaseStep(metaclass=BaseStepMeta):
         self._configuration = pydantic_utils.update_model(
             self._configuration, update=config, recursive=merge
         )
+        if config.outputs:
+            # The materializer sources are part of the caching parameters
+            self._caching_parameters = None
 
-        logger.debug("Updated step configuration:")
-        logger.debug(self._configuration)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated step configuration:")
+            logger.debug(self._configuration)
 
     def _validate_configuration(self, config: StepConfigurationUpdate) -> None:
         """Validates a configuration update.
@@ -893,14 +1027,21 @@ class BaseStep(metaclass=BaseStepMeta):
                 configured of an output artifact/materializer source does not
                 resolve to the correct class.
         """
-        allowed_output_names = set(self.entrypoint_definition.outputs)
+        if not outputs:
+            return
+
+        allowed_output_names = self._ALLOWED_OUTPUT_NAMES
+        if allowed_output_names is None:
+            allowed_output_names = frozenset(
+                self.entrypoint_definition.outputs
+            )
         for output_name, output in outputs.items():
             if output_name not in allowed_output_names:
                 raise StepInterfaceError(
                     f"Got unexpected materializers for non-existent "
                     f"output '{output_name}' in step '{self.name}'. "
                     f"Only materializers for the outputs "
-                    f"{allowed_output_names} of this step can"
+                    f"{set(allowed_output_names)} of this step can"
                     f" be registered."
                 )
 
@@ -972,14 +1113,6 @@ class BaseStep(metaclass=BaseStepMeta):
                 output_name, PartialArtifactConfiguration()
             )
 
-            from pydantic.typing import (
-                get_origin,
-                is_none_type,
-                is_union,
-            )
-
-            from zenml.steps.utils import get_args
-
             if not output.materializer_source:
                 if output_annotation is Any:
                     outputs[output_name]["materializer_source"] = ()
@@ -990,28 +1123,9 @@ class BaseStep(metaclass=BaseStepMeta):
                     )
                     continue
 
-                if is_union(
-                    get_origin(output_annotation) or output_annotation
-                ):
-                    output_types = tuple(
-                        type(None)
-                        if is_none_type(output_type)
-                        else output_type
-                        for output_type in get_args(output_annotation)
-                    )
-                else:
-                    output_types = (output_annotation,)
-
-                materializer_sources = []
-
-                for output_type in output_types:
-                    materializer_class = materializer_registry[output_type]
-                    materializer_sources.append(
-                        source_utils.resolve(materializer_class)
-                    )
-
                 outputs[output_name]["materializer_source"] = tuple(
-                    materializer_sources
+                    source_utils.resolve(materializer_registry[output_type])
+                    for output_type in _get_output_types(output_annotation)
                 )
 
         parameters = self._finalize_parameters()
@@ -1021,9 +1135,25 @@ class BaseStep(metaclass=BaseStepMeta):
             external_artifacts=external_artifacts,
         )
 
-        values = dict_utils.remove_none_values({"outputs": outputs or None})
-        config = StepConfigurationUpdate(**values)
-        self._apply_configuration(config)
+        if outputs:
+            # The output names come from the entrypoint definition and the
+            # materializer sources were resolved above, so the outputs can be
+            # merged without validating and re-parsing the whole configuration.
+            # They get validated when creating the final configuration below.
+            merged_outputs = dict(self._configuration.outputs)
+            for output_name, output_update in outputs.items():
+                existing_output = merged_outputs.get(output_name)
+                merged_outputs[output_name] = (
+                    existing_output.copy(update=output_update)
+                    if existing_output
+                    else PartialArtifactConfiguration(**output_update)
+                )
+
+            self._configuration = self._configuration.copy(
+                update={"outputs": merged_outputs}
+            )
+            # The materializer sources are part of the caching parameters
+            self._caching_parameters = None
 
         self._configuration = self._configuration.copy(
             update={
@@ -1032,7 +1162,15 @@ class BaseStep(metaclass=BaseStepMeta):
             }
         )
 
-        return StepConfiguration.parse_obj(self._configuration)
+        # All values except the outputs were already validated when creating
+        # the partial configuration and have the same types in the full step
+        # configuration, so we only need to validate the outputs.
+        values = dict(self._configuration)
+        values["outputs"] = {
+            output_name: ArtifactConfiguration.parse_obj(dict(output))
+            for output_name, output in self._configuration.outputs.items()
+        }
+        return StepConfiguration.construct(**values)
 
     def _finalize_parameters(self) -> Dict[str, Any]:
         """Finalizes the config parameters for running this step.
@@ -1046,13 +1184,10 @@ class BaseStep(metaclass=BaseStepMeta):
                 continue
 
             annotation = self.entrypoint_definition.inputs[key].annotation
-            annotation = resolve_type_annotation(annotation)
-            if inspect.isclass(annotation) and issubclass(
-                annotation, BaseModel
-            ):
+            if is_subclass_annotation(annotation, BaseModel):
                 # Make sure we have all necessary values to instantiate the
                 # pydantic model later
-                model = annotation(**value)
+                model = resolve_type_annotation(annotation)(**value)
                 params[key] = model.dict()
             else:
                 params[key] = value
@@ -1094,55 +1229,46 @@ class BaseStep(metaclass=BaseStepMeta):
             "`BaseParameters` class."
         )
 
+        legacy_params = self.entrypoint_definition.legacy_params
+        parameters = self.configuration.parameters
         # parameters for the `BaseParameters` class specified in the "new" way
         # by specifying a dict of parameters for the corresponding key
-        params_defined_in_new_way = (
-            self.configuration.parameters.get(
-                self.entrypoint_definition.legacy_params.name
-            )
-            or {}
-        )
+        params_defined_in_new_way = parameters.get(legacy_params.name) or {}
 
         values = {}
         missing_keys = []
-        for (
-            name,
-            field,
-        ) in (
-            self.entrypoint_definition.legacy_params.annotation.__fields__.items()
+        for name, required, default in _get_parameter_fields(
+            legacy_params.annotation
         ):
-            if name in self.configuration.parameters:
+            if name in parameters:
                 # a value for this parameter has been set already
-                values[name] = self.configuration.parameters[name]
+                values[name] = parameters[name]
             elif name in params_defined_in_new_way:
                 # a value for this parameter has been set in the "new" way
                 # already
                 values[name] = params_defined_in_new_way[name]
-            elif field.required:
+            elif required:
                 # this field has no default value set and therefore needs
                 # to be passed via an initialized config object
                 missing_keys.append(name)
             else:
                 # use default value from the pydantic config class
-                values[name] = field.default
+                values[name] = default
 
         if missing_keys:
             raise MissingStepParameterError(
                 self.name,
                 missing_keys,
-                self.entrypoint_definition.legacy_params.annotation,
+                legacy_params.annotation,
             )
 
-        if (
-            self.entrypoint_definition.legacy_params.annotation.__config__.extra
-            == Extra.allow
-        ):
+        if legacy_params.annotation.__config__.extra == Extra.allow:
             # Add all parameters for the config class for backwards
             # compatibility if the config class allows extra attributes
-            values.update(self.configuration.parameters)
+            values.update(parameters)
 
         try:
-            self.entrypoint_definition.legacy_params.annotation(**values)
+            legacy_params.annotation(**values)
         except ValidationError:
             raise StepInterfaceError("Failed to validate function parameters.")
 
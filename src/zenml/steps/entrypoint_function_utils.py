@@ -25,18 +25,20 @@ from typing import (
     Union,
 )
 
-from pydantic import BaseConfig, ValidationError, create_model
+from pydantic import BaseConfig, BaseModel, ValidationError, create_model
 
 from zenml.constants import ENFORCE_TYPE_ANNOTATIONS
 from zenml.exceptions import StepInterfaceError
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.materializers.unmaterialized_artifact import UnmaterializedArtifact
 from zenml.steps.external_artifact import ExternalArtifact
 from zenml.steps.utils import (
+    is_subclass_annotation,
     parse_return_type_annotations,
-    resolve_type_annotation,
 )
 from zenml.utils import yaml_utils
+from zenml.utils.memoization_utils import lru_cache_if_hashable
 
 if TYPE_CHECKING:
     from zenml.config.source import Source
@@ -47,32 +49,37 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+_VARIADIC_PARAMETER_KINDS = frozenset(
+    {inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD}
+)
+
 
-def get_step_entrypoint_signature(step: "BaseStep") -> inspect.Signature:
-    """Get the entrypoint signature of a step.
+def get_step_entrypoint_signature(
+    step_class: Type["BaseStep"],
+) -> inspect.Signature:
+    """Get the entrypoint signature of a step class.
 
     Args:
-        step: The step for which to get the entrypoint signature.
+        step_class: The step class for which to get the entrypoint signature.
 
     Returns:
         The entrypoint function signature.
     """
     from zenml.steps import BaseParameters, StepContext
 
-    signature = inspect.signature(step.entrypoint, follow_wrapped=True)
-
-    def _is_param_of_class(annotation: Any, class_: Type[Any]) -> bool:
-        annotation = resolve_type_annotation(annotation)
-        return inspect.isclass(annotation) and issubclass(annotation, class_)
+    signature = inspect.signature(step_class.entrypoint, follow_wrapped=True)
 
     parameters = list(signature.parameters.values())
+    if parameters and parameters[0].name == "self":
+        # The entrypoint of class-based steps is an unbound instance method
+        parameters = parameters[1:]
 
     # Filter out deprecated args: step context and legacy parameters
     parameters = [
         param
         for param in parameters
-        if not _is_param_of_class(param.annotation, class_=BaseParameters)
-        and not _is_param_of_class(param.annotation, class_=StepContext)
+        if not is_subclass_annotation(param.annotation, BaseParameters)
+        and not is_subclass_annotation(param.annotation, StepContext)
     ]
 
     signature = signature.replace(parameters=parameters)
@@ -153,15 +160,12 @@ class EntrypointFunctionDefinition(NamedTuple):
             StepInterfaceError: If the input is a parameter and not JSON
                 serializable.
         """
-        from zenml.materializers import UnmaterializedArtifact
-
-        if key not in self.inputs:
+        parameter = self.inputs.get(key)
+        if parameter is None:
             raise KeyError(
                 f"Received step entrypoint input for invalid key {key}."
             )
 
-        parameter = self.inputs[key]
-
         if isinstance(value, (StepArtifact, ExternalArtifact)):
             # If we were to do any type validation for artifacts here, we
             # would not be able to leverage pydantics type coercion (e.g.
@@ -202,21 +206,41 @@ class EntrypointFunctionDefinition(NamedTuple):
             parameter: The function parameter for which the value was provided.
             value: The input value.
         """
-
-        class ModelConfig(BaseConfig):
-            arbitrary_types_allowed = False
-
-        # Create a pydantic model with just a single required field with the
-        # type annotation of the parameter to verify the input type including
-        # pydantics type coercion
-        validation_model_class = create_model(
-            "input_validation_model",
-            __config__=ModelConfig,
-            value=(parameter.annotation, ...),
+        validation_model_class = _get_input_validation_model(
+            parameter.annotation
         )
         validation_model_class(value=value)
 
 
+class _InputValidationModelConfig(BaseConfig):
+    """Pydantic config for input validation models."""
+
+    arbitrary_types_allowed = False
+
+
+@lru_cache_if_hashable(maxsize=1024)
+def _get_input_validation_model(annotation: Any) -> Type[BaseModel]:
+    """Gets a pydantic model to validate an input value.
+
+    Creating a pydantic model is expensive, so the model is cached per
+    annotation if the annotation is hashable.
+
+    Args:
+        annotation: The type annotation of the input.
+
+    Returns:
+        The validation model class.
+    """
+    # Create a pydantic model with just a single required field with the
+    # type annotation of the parameter to verify the input type including
+    # pydantics type coercion
+    return create_model(
+        "input_validation_model",
+        __config__=_InputValidationModelConfig,
+        value=(annotation, ...),
+    )
+
+
 def validate_entrypoint_function(
     func: Callable[..., Any], reserved_arguments: Sequence[str] = ()
 ) -> EntrypointFunctionDefinition:
@@ -260,7 +284,7 @@ def validate_entrypoint_function(
         signature_parameters = signature_parameters[1:]
 
     for key, parameter in signature_parameters:
-        if parameter.kind in {parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD}:
+        if parameter.kind in _VARIADIC_PARAMETER_KINDS:
             raise StepInterfaceError(
                 f"Variable args or kwargs not allowed for function "
                 f"{func.__name__}."
@@ -277,10 +301,7 @@ def validate_entrypoint_function(
             # If a type annotation is missing, use `Any` instead
             parameter = parameter.replace(annotation=Any)
 
-        annotation = resolve_type_annotation(annotation)
-        if inspect.isclass(annotation) and issubclass(
-            annotation, BaseParameters
-        ):
+        if is_subclass_annotation(annotation, BaseParameters):
             if legacy_params is not None:
                 raise StepInterfaceError(
                     f"Found multiple parameter arguments "
@@ -289,9 +310,7 @@ def validate_entrypoint_function(
                 )
             legacy_params = parameter
 
-        elif inspect.isclass(annotation) and issubclass(
-            annotation, StepContext
-        ):
+        elif is_subclass_annotation(annotation, StepContext):
             if context is not None:
                 raise StepInterfaceError(
                     f"Found multiple context arguments "
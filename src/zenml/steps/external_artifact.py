@@ -107,6 +107,9 @@ class ExternalArtifact:
         self._materializer = materializer
         self._store_artifact_metadata = store_artifact_metadata
         self._store_artifact_visualizations = store_artifact_visualizations
+        # ID of the artifact store in which the artifact referenced by
+        # `self._id` was uploaded or verified to exist
+        self._artifact_store_id: Optional[UUID] = None
 
     def _validate_init_params(
         self,
@@ -167,7 +170,13 @@ class ExternalArtifact:
         Returns:
             The artifact ID.
         """
-        artifact_store_id = Client().active_stack.artifact_store.id
+        client = Client()
+        artifact_store = client.active_stack.artifact_store
+        artifact_store_id = artifact_store.id
+
+        if self._id and self._artifact_store_id == artifact_store_id:
+            # The artifact was already uploaded or verified for this store
+            return self._id
 
         if self._value:
             logger.info("Uploading external artifact...")
@@ -177,7 +186,7 @@ class ExternalArtifact:
             )
 
             uri = os.path.join(
-                Client().active_stack.artifact_store.path,
+                artifact_store.path,
                 "external_artifacts",
                 artifact_name,
             )
@@ -205,9 +214,9 @@ class ExternalArtifact:
         else:
             response = None
             if self._id:
-                response = Client().get_artifact(artifact_id=self._id)
+                response = client.get_artifact(artifact_id=self._id)
             elif self._pipeline_name and self._artifact_name:
-                pipeline = Client().get_pipeline(self._pipeline_name)
+                pipeline = client.get_pipeline(self._pipeline_name)
                 for artifact in pipeline.last_successful_run.artifacts:
                     if artifact.name == self._artifact_name:
                         response = artifact
@@ -229,6 +238,7 @@ class ExternalArtifact:
                 )
             self._id = response.id
 
+        self._artifact_store_id = artifact_store_id
         return self._id
 
     def _get_materializer_class(self, value: Any) -> Type["BaseMaterializer"]:
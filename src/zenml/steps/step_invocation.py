@@ -12,7 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Step invocation class definition."""
-from typing import TYPE_CHECKING, Any, Dict, Set
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 if TYPE_CHECKING:
     from zenml.config.step_configurations import StepConfiguration
@@ -53,6 +54,9 @@ class StepInvocation:
         self.parameters = parameters
         self.invocation_upstream_steps = upstream_steps
         self.pipeline = pipeline
+        # Upstream steps defined on the step instance, validated and stored
+        # when finalizing the invocation
+        self._step_upstream_steps: Optional[Set[str]] = None
 
     @property
     def upstream_steps(self) -> Set[str]:
@@ -61,9 +65,11 @@ class StepInvocation:
         Returns:
             The upstream steps of the invocation.
         """
-        return self.invocation_upstream_steps.union(
-            self._get_and_validate_step_upstream_steps()
-        )
+        step_upstream_steps = self._step_upstream_steps
+        if step_upstream_steps is None:
+            step_upstream_steps = self._get_and_validate_step_upstream_steps()
+
+        return self.invocation_upstream_steps.union(step_upstream_steps)
 
     def _get_and_validate_step_upstream_steps(self) -> Set[str]:
         """Validates the upstream steps defined on the step instance.
@@ -75,24 +81,27 @@ class StepInvocation:
         Returns:
             The upstream steps defined on the step instance.
         """
+        if not self.step.upstream_steps:
+            return set()
+
+        # Collect the invocation IDs of all steps in a single pass instead of
+        # searching all invocations for each upstream step
+        invocation_ids: Dict["BaseStep", List[str]] = defaultdict(list)
+        for invocation in self.pipeline.invocations.values():
+            invocation_ids[invocation.step].append(invocation.id)
 
         def _verify_single_invocation(step: "BaseStep") -> str:
-            invocations = {
-                invocation
-                for invocation in self.pipeline.invocations.values()
-                if invocation.step is step
-            }
-            if len(invocations) > 1:
+            step_invocation_ids = invocation_ids[step]
+            if len(step_invocation_ids) > 1:
                 raise RuntimeError(
                     "Setting upstream steps for a step using "
                     "`step_1.after(step_2)` is not allowed in combination "
                     "with calling one of the two steps multiple times."
                 )
-            return invocations.pop().id
+            return step_invocation_ids[0]
 
-        if self.step.upstream_steps:
-            # If the step has upstream steps, make sure it only got invoked once
-            _verify_single_invocation(step=self.step)
+        # If the step has upstream steps, make sure it only got invoked once
+        _verify_single_invocation(step=self.step)
 
         upstream_steps = set()
 
@@ -117,8 +126,12 @@ class StepInvocation:
         Returns:
             The finalized step configuration.
         """
-        # Validate the upstream steps for legacy .after() calls
-        self._get_and_validate_step_upstream_steps()
+        # Validate the upstream steps for legacy .after() calls. All steps of
+        # the pipeline have been invoked at this point, so the result can be
+        # reused whenever the upstream steps are accessed afterwards.
+        self._step_upstream_steps = (
+            self._get_and_validate_step_upstream_steps()
+        )
 
         parameters_to_apply = {
             key: value
@@ -17,7 +17,7 @@
 import ast
 import inspect
 import textwrap
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 
 import pydantic.typing as pydantic_typing
 from typing_extensions import Annotated
@@ -25,6 +25,7 @@ from typing_extensions import Annotated
 from zenml.logger import get_logger
 from zenml.steps.step_output import Output
 from zenml.utils import source_code_utils
+from zenml.utils.memoization_utils import lru_cache_if_hashable
 
 logger = get_logger(__name__)
 
@@ -157,6 +158,24 @@ def resolve_type_annotation(obj: Any) -> Any:
     return origin
 
 
+@lru_cache_if_hashable(maxsize=4096)
+def is_subclass_annotation(annotation: Any, class_: Type[Any]) -> bool:
+    """Checks whether a type annotation resolves to a subclass of a class.
+
+    Step annotations are checked against the same few classes over and over
+    again, so the result gets cached if the annotation is hashable.
+
+    Args:
+        annotation: The type annotation to check.
+        class_: The class to check against.
+
+    Returns:
+        Whether the resolved annotation is a subclass of the given class.
+    """
+    annotation = resolve_type_annotation(annotation)
+    return isinstance(annotation, type) and issubclass(annotation, class_)
+
+
 def get_output_name_from_annotation_metadata(annotation: Any) -> Optional[str]:
     """Get the output name from a type annotation.
 
@@ -402,20 +402,21 @@ def upload_artifact(
                 f"Failed to extract metadata for output artifact '{name}': {e}"
             )
 
+    client = Client()
     artifact = ArtifactRequestModel(
         name=name,
         type=materializer.ASSOCIATED_ARTIFACT_TYPE,
         uri=materializer.uri,
         materializer=source_utils.resolve(materializer.__class__),
         data_type=source_utils.resolve(data_type),
-        user=Client().active_user.id,
-        workspace=Client().active_workspace.id,
+        user=client.active_user.id,
+        workspace=client.active_workspace.id,
         artifact_store_id=artifact_store_id,
         visualizations=visualizations,
     )
-    response = Client().zen_store.create_artifact(artifact=artifact)
+    response = client.zen_store.create_artifact(artifact=artifact)
     if artifact_metadata:
-        Client().create_run_metadata(
+        client.create_run_metadata(
             metadata=artifact_metadata, artifact_id=response.id
         )
 
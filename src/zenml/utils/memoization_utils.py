@@ -0,0 +1,68 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utils for memoizing function results."""
+
+import functools
+from typing import Any, Callable, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def lru_cache_if_hashable(maxsize: int = 128) -> Callable[[F], F]:
+    """Caches the results of a function for hashable arguments.
+
+    Calls with any unhashable argument (e.g. an `Annotated` type annotation
+    with dictionary metadata) run the function without caching.
+
+    Args:
+        maxsize: The maximum number of cached results.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        """Decorator that adds the cache to a function.
+
+        Args:
+            func: The function to decorate.
+
+        Returns:
+            The decorated function.
+        """
+        cached_func = functools.lru_cache(maxsize=maxsize)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Calls the cached function if all arguments are hashable.
+
+            Args:
+                *args: Positional arguments of the function.
+                **kwargs: Keyword arguments of the function.
+
+            Returns:
+                The function result.
+            """
+            try:
+                hash((args, tuple(kwargs.items())))
+            except TypeError:
+                return func(*args, **kwargs)
+
+            return cached_func(*args, **kwargs)
+
+        setattr(wrapper, "cache_info", cached_func.cache_info)
+        setattr(wrapper, "cache_clear", cached_func.cache_clear)
+        return cast(F, wrapper)
+
+    return decorator
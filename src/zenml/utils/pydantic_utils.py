@@ -14,7 +14,17 @@
 """Utilities for pydantic models."""
 import inspect
 import json
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import yaml
 from pydantic import BaseModel
@@ -23,6 +33,7 @@ from pydantic.json import pydantic_encoder
 from pydantic.utils import sequence_like
 
 from zenml.utils import dict_utils, yaml_utils
+from zenml.utils.memoization_utils import lru_cache_if_hashable
 
 M = TypeVar("M", bound="BaseModel")
 
@@ -209,6 +220,89 @@ class YAMLSerializationMixin(BaseModel):
         return cls.parse_obj(dict_)
 
 
+_VALIDATED_FUNCTION_PARAMETER_PREFIX = "zenml__"
+
+
+@lru_cache_if_hashable(maxsize=256)
+def _create_validated_function(
+    func: Callable[..., Any],
+    config_items: Tuple[Tuple[str, Any], ...],
+    skip_first_parameter: bool = False,
+) -> ValidatedFunction:
+    """Creates a pydantic validated function for a function.
+
+    Args:
+        func: The function for which to create the validated function.
+        config_items: The items of the pydantic config for the underlying
+            model that is created to validate the types of the arguments.
+        skip_first_parameter: If `True`, the first parameter of the function
+            will not be part of the validated function. This is used to
+            create validated functions for the underlying function of a
+            bound method.
+
+    Returns:
+        The validated function.
+    """
+    parameter_prefix = _VALIDATED_FUNCTION_PARAMETER_PREFIX
+
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    if skip_first_parameter:
+        parameters = parameters[1:]
+
+    parameter_names = {param.name for param in parameters}
+    signature = signature.replace(
+        parameters=[
+            param.replace(name=f"{parameter_prefix}{param.name}")
+            for param in parameters
+        ]
+    )
+
+    def f() -> None:
+        pass
+
+    # We create a dummy function with the original function signature, but
+    # add a prefix to all arguments to avoid potential clashes with pydantic
+    # BaseModel attributes
+    f.__signature__ = signature  # type: ignore[attr-defined]
+    f.__annotations__ = {
+        f"{parameter_prefix}{key}": annotation
+        for key, annotation in func.__annotations__.items()
+        if key in parameter_names or key == "return"
+    }
+
+    return ValidatedFunction(f, config=dict(config_items))
+
+
+def get_validated_function(
+    func: Callable[..., Any], config: Dict[str, Any]
+) -> ValidatedFunction:
+    """Gets a pydantic validated function for a function.
+
+    Creating the validated function builds a new pydantic model, which is
+    expensive. The validated function is therefore cached per function and
+    config if both of them are hashable. For bound methods, the cache is keyed
+    on the underlying function so that it is shared between all instances and
+    doesn't keep any instance alive.
+
+    Args:
+        func: The function for which to get the validated function.
+        config: The pydantic config for the underlying model that is created
+            to validate the types of the arguments.
+
+    Returns:
+        The validated function.
+    """
+    skip_first_parameter = inspect.ismethod(func)
+    if skip_first_parameter:
+        # The first parameter (`self` or `cls`) is already bound
+        func = func.__func__  # type: ignore[attr-defined]
+
+    return _create_validated_function(
+        func, tuple(sorted(config.items())), skip_first_parameter
+    )
+
+
 def validate_function_args(
     __func: Callable[..., Any],
     __config: Dict[str, Any],
@@ -232,28 +326,8 @@ def validate_function_args(
     Returns:
         The validated arguments.
     """
-    parameter_prefix = "zenml__"
-
-    signature = inspect.signature(__func)
-    parameters = [
-        param.replace(name=f"{parameter_prefix}{param.name}")
-        for param in signature.parameters.values()
-    ]
-    signature = signature.replace(parameters=parameters)
-
-    def f() -> None:
-        pass
-
-    # We create a dummy function with the original function signature, but
-    # add a prefix to all arguments to avoid potential clashes with pydantic
-    # BaseModel attributes
-    f.__signature__ = signature  # type: ignore[attr-defined]
-    f.__annotations__ = {
-        f"{parameter_prefix}{key}": annotation
-        for key, annotation in __func.__annotations__.items()
-    }
-
-    validation_func = ValidatedFunction(f, config=__config)
+    parameter_prefix = _VALIDATED_FUNCTION_PARAMETER_PREFIX
+    validation_func = get_validated_function(__func, __config)
 
     kwargs = {
         f"{parameter_prefix}{key}": value for key, value in kwargs.items()
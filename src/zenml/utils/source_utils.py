@@ -24,6 +24,7 @@ from types import ModuleType
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterator,
     Optional,
     Type,
@@ -48,6 +49,18 @@ NoneTypeSource = Source(
 
 _CUSTOM_SOURCE_ROOT: Optional[str] = None
 
+# Source types for which the resolved source of an object only depends on the
+# object itself. User sources also depend on the source root and the active
+# code repository, which can both change during the lifetime of a process.
+_CACHEABLE_SOURCE_TYPES = frozenset(
+    {
+        SourceType.BUILTIN,
+        SourceType.INTERNAL,
+        SourceType.DISTRIBUTION_PACKAGE,
+    }
+)
+_RESOLVED_SOURCES: Dict[Any, Source] = {}
+
 
 def load(source: Union[Source, str]) -> Any:
     """Load a source or import path.
@@ -108,6 +121,39 @@ def resolve(
 ) -> Source:
     """Resolve an object.
 
+    Args:
+        obj: The object to resolve.
+        skip_validation: If True, the validation that the object exist in the
+            module is skipped.
+
+    Raises:
+        RuntimeError: If the object can't be resolved.
+
+    Returns:
+        The source of the resolved object.
+    """
+    try:
+        cached_source = _RESOLVED_SOURCES.get(obj)
+    except TypeError:
+        # Unhashable object, we can't cache the resolved source
+        return _resolve(obj, skip_validation=skip_validation)
+
+    if cached_source:
+        return cached_source
+
+    source = _resolve(obj, skip_validation=skip_validation)
+    if not skip_validation and source.type in _CACHEABLE_SOURCE_TYPES:
+        _RESOLVED_SOURCES[obj] = source
+
+    return source
+
+
+def _resolve(
+    obj: Union[Type[Any], Callable[..., Any], ModuleType, NoneType],
+    skip_validation: bool = False,
+) -> Source:
+    """Resolve an object without using the source cache.
+
     Args:
         obj: The object to resolve.
         skip_validation: If True, the validation that the object exist in the
@@ -19,6 +19,7 @@ from typing import Any, Dict, List, Optional, Type, Union
 from uuid import UUID
 
 import yaml
+from pydantic.json import pydantic_encoder
 
 from zenml.io import fileio
 from zenml.utils import io_utils
@@ -184,6 +185,32 @@ class UUIDEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+_JSON_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_flat_json_value(obj: Any) -> bool:
+    """Checks whether an object is a JSON primitive or a flat container.
+
+    Args:
+        obj: The object to check.
+
+    Returns:
+        Whether the object is a JSON primitive, or a list, tuple or dict that
+        only contains JSON primitives.
+    """
+    if isinstance(obj, _JSON_PRIMITIVE_TYPES):
+        return True
+    elif isinstance(obj, (list, tuple)):
+        return all(isinstance(v, _JSON_PRIMITIVE_TYPES) for v in obj)
+    elif isinstance(obj, dict):
+        return all(
+            isinstance(k, _JSON_PRIMITIVE_TYPES)
+            and isinstance(v, _JSON_PRIMITIVE_TYPES)
+            for k, v in obj.items()
+        )
+    return False
+
+
 def is_json_serializable(obj: Any) -> bool:
     """Checks whether an object is JSON serializable.
 
@@ -193,7 +220,10 @@ def is_json_serializable(obj: Any) -> bool:
     Returns:
         Whether the object is JSON serializable using pydantics encoder class.
     """
-    from pydantic.json import pydantic_encoder
+    if _is_flat_json_value(obj):
+        # Skip serializing the most common values, they can always be
+        # serialized
+        return True
 
     try:
         json.dumps(obj, default=pydantic_encoder)
@@ -0,0 +1,55 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.logging import step_logging
+from zenml.logging.step_logging import StepLogsStorage
+
+
+def test_logs_storage_saves_when_buffer_is_full(tmp_path):
+    """Tests that the buffer gets saved once it reaches the max size."""
+    logs_uri = str(tmp_path / "logs.log")
+    storage = StepLogsStorage(
+        logs_uri=logs_uri, max_messages=2, time_interval=1000
+    )
+
+    storage.write("message_1")
+    assert not (tmp_path / "logs.log").exists()
+
+    storage.write("message_2")
+    assert (tmp_path / "logs.log").read_text() == "message_1\nmessage_2\n"
+    assert storage.buffer == []
+
+
+def test_logs_storage_saves_after_time_interval(tmp_path, mocker):
+    """Tests that the buffer gets saved once the time interval expired."""
+    mocked_time = mocker.patch.object(step_logging, "time")
+    mocked_time.monotonic.return_value = 0
+
+    logs_uri = str(tmp_path / "logs.log")
+    storage = StepLogsStorage(
+        logs_uri=logs_uri, max_messages=100, time_interval=10
+    )
+
+    storage.write("message_1")
+    storage.write("\n")
+    mocked_time.monotonic.return_value = 9
+    storage.write("message_2")
+    assert not (tmp_path / "logs.log").exists()
+
+    mocked_time.monotonic.return_value = 10
+    storage.write("message_3")
+    assert (
+        tmp_path / "logs.log"
+    ).read_text() == "message_1\nmessage_2\nmessage_3\n"
+    assert storage.buffer == []
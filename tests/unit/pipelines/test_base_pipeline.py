@@ -84,6 +84,35 @@ def test_initialize_pipeline_with_args_and_kwargs(
         unconnected_two_step_pipeline(empty_step_1(), step_2=empty_step_2())
 
 
+def test_pipeline_connect_signature_is_computed_once_per_class(
+    generate_empty_steps,
+):
+    """Tests that the connect signature is stored on each pipeline class."""
+
+    class ParentPipeline(BasePipeline):
+        def connect(self, step_1):
+            step_1()
+
+    class ChildPipeline(ParentPipeline):
+        def connect(self, step_1, step_2):
+            step_1()
+            step_2()
+
+    empty_step_1, empty_step_2 = generate_empty_steps(2)
+    ParentPipeline(empty_step_1())
+    signature = ParentPipeline._CONNECT_SIGNATURE
+    assert list(signature.parameters) == ["step_1"]
+
+    ParentPipeline(empty_step_1())
+    assert ParentPipeline._CONNECT_SIGNATURE is signature
+
+    ChildPipeline(empty_step_1(), empty_step_2())
+    assert list(ChildPipeline._CONNECT_SIGNATURE.parameters) == [
+        "step_1",
+        "step_2",
+    ]
+
+
 def test_initialize_pipeline_with_too_many_args(
     unconnected_two_step_pipeline, generate_empty_steps
 ):
@@ -17,6 +17,7 @@ from typing import Dict, List, Optional
 import pytest
 from pydantic import BaseModel
 
+from zenml.constants import STEP_SOURCE_PARAMETER_NAME
 from zenml.environment import Environment
 from zenml.exceptions import MissingStepParameterError, StepInterfaceError
 from zenml.materializers import BuiltInMaterializer
@@ -164,6 +165,53 @@ def test_define_step_with_keyword_only_arguments():
     assert "keyword_only_argument" in some_step().entrypoint_definition.inputs
 
 
+def test_step_entrypoint_signature_is_stored_per_class():
+    """Tests that the entrypoint signature is stored on each step class."""
+    from zenml.steps import BaseStep
+
+    class ParentStep(BaseStep):
+        def entrypoint(self, a: int) -> None:
+            pass
+
+    class ChildStep(ParentStep):
+        def entrypoint(self, a: int, b: int) -> None:
+            pass
+
+    parent_signature = ParentStep._ENTRYPOINT_SIGNATURE
+    assert list(parent_signature.parameters) == ["a"]
+    assert ParentStep()._get_entrypoint_signature() is parent_signature
+
+    child_signature = ChildStep._ENTRYPOINT_SIGNATURE
+    assert list(child_signature.parameters) == ["a", "b"]
+    assert ChildStep()._get_entrypoint_signature() is child_signature
+
+
+def test_step_entrypoint_definition_is_shared_between_instances():
+    """Tests that step instances reuse the entrypoint definition of their class."""
+    from zenml.steps import BaseStep
+
+    class ParentStep(BaseStep):
+        def entrypoint(self, a: int) -> None:
+            pass
+
+    class ChildStep(ParentStep):
+        def entrypoint(self, a: int, b: int) -> None:
+            pass
+
+    assert (
+        ParentStep().entrypoint_definition
+        is ParentStep().entrypoint_definition
+    )
+    assert set(ChildStep().entrypoint_definition.inputs) == {"a", "b"}
+
+    class StepWithReservedArgument(BaseStep):
+        def entrypoint(self, after: int) -> None:
+            pass
+
+    with pytest.raises(RuntimeError):
+        StepWithReservedArgument()
+
+
 def test_initialize_step_with_unexpected_config():
     """Tests that passing a config to a step that was defined without config raises an Exception."""
 
@@ -829,6 +877,47 @@ def test_configure_step_with_invalid_materializer_key_or_source():
         )
 
 
+def test_caching_parameters_get_updated_when_configuring_materializers():
+    """Tests that the cached caching parameters of a step get recomputed when
+    the output materializers change."""
+
+    @step
+    def s() -> int:
+        return 0
+
+    step_instance = s()
+    assert "output_materializer_source" not in step_instance.caching_parameters
+
+    step_instance.configure(enable_cache=False)
+    assert "output_materializer_source" not in step_instance.caching_parameters
+
+    step_instance.configure(
+        output_materializers={"output": BuiltInMaterializer}
+    )
+    assert "output_materializer_source" in step_instance.caching_parameters
+
+
+def test_step_copy_recomputes_source_hash_after_code_change():
+    """Tests that the step source hash of a copied step reflects code that was
+    replaced in place, e.g. by IPython autoreload."""
+
+    @step
+    def s() -> int:
+        return 0
+
+    def other() -> int:
+        return 1
+
+    step_instance = s()
+    source_hash = step_instance.caching_parameters[STEP_SOURCE_PARAMETER_NAME]
+
+    step_instance.entrypoint.__code__ = other.__code__
+    assert (
+        step_instance.copy().caching_parameters[STEP_SOURCE_PARAMETER_NAME]
+        != source_hash
+    )
+
+
 def test_configure_step_with_invalid_parameters():
     """Tests that configuring a step with an invalid parameter key raises an
     error."""
@@ -13,13 +13,17 @@
 #  permissions and limitations under the License.
 import sys
 from contextlib import ExitStack as does_not_raise
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 import pytest
 from pydantic import BaseModel
 
 from zenml import pipeline, step
 from zenml.exceptions import StepInterfaceError
+from zenml.materializers import (
+    BuiltInContainerMaterializer,
+    BuiltInMaterializer,
+)
 
 
 @step
@@ -132,6 +136,100 @@ def test_step_parameter_merging():
     )
 
 
+@step
+def step_without_inputs() -> None:
+    pass
+
+
+def test_step_invocation_upstream_steps():
+    """Tests that the `after` argument adds the upstream steps of an
+    invocation."""
+
+    @pipeline
+    def test_pipeline():
+        step_with_int_input(input_=1, id="first")
+        step_with_int_input(input_=2, id="second")
+        step_without_inputs(id="after_both", after=["first", "second"])
+        step_without_inputs(id="after_first", after="first")
+
+    test_pipeline.prepare()
+    invocations = test_pipeline.invocations
+    assert invocations["after_both"].upstream_steps == {"first", "second"}
+    assert invocations["after_first"].upstream_steps == {"first"}
+
+
+def test_step_invocation_reuses_validated_upstream_steps(mocker):
+    """Tests that the upstream steps validated when finalizing an invocation
+    are reused afterwards."""
+
+    @pipeline
+    def test_pipeline():
+        step_with_int_input(input_=1, id="first")
+        step_without_inputs(id="second", after="first")
+
+    test_pipeline.prepare()
+    invocation = test_pipeline.invocations["second"]
+    invocation.finalize(parameters_to_ignore=set())
+
+    validation_spy = mocker.spy(
+        invocation, "_get_and_validate_step_upstream_steps"
+    )
+    assert invocation.upstream_steps == {"first"}
+    validation_spy.assert_not_called()
+
+
+@step
+def step_with_int_or_list_output() -> Union[int, list]:
+    return 1
+
+
+@step
+def step_with_list_or_int_output() -> Union[list, int]:
+    return 1
+
+
+def test_union_output_materializers_follow_annotation_order():
+    """Tests that the materializers of a union output are in the order of
+    the union members."""
+    int_or_list_config = (
+        step_with_int_or_list_output.copy()._finalize_configuration(
+            input_artifacts={}, external_artifacts={}
+        )
+    )
+    list_or_int_config = (
+        step_with_list_or_int_output.copy()._finalize_configuration(
+            input_artifacts={}, external_artifacts={}
+        )
+    )
+
+    assert [
+        source.attribute
+        for source in int_or_list_config.outputs["output"].materializer_source
+    ] == [BuiltInMaterializer.__name__, BuiltInContainerMaterializer.__name__]
+    assert [
+        source.attribute
+        for source in list_or_int_config.outputs["output"].materializer_source
+    ] == [BuiltInContainerMaterializer.__name__, BuiltInMaterializer.__name__]
+
+
+@step
+def step_with_default_inputs(a: int, b: int = 2, c: int = 3) -> None:
+    pass
+
+
+def test_step_call_applies_entrypoint_defaults():
+    """Tests that entrypoint defaults are only used for parameters that are
+    neither passed nor configured."""
+
+    @pipeline
+    def test_pipeline():
+        step_with_default_inputs.with_options(parameters={"c": 5})(a=1)
+
+    test_pipeline.prepare()
+    invocation = test_pipeline.invocations["step_with_default_inputs"]
+    assert invocation.parameters == {"a": 1, "b": 2}
+
+
 if sys.version_info >= (3, 9):
 
     @step
@@ -116,6 +116,22 @@ def test_upload_if_necessary_by_value(
     assert ea._artifact_name is None
 
 
+@patch("zenml.steps.external_artifact.Client")
+@patch("zenml.steps.external_artifact.fileio")
+@patch("zenml.steps.external_artifact.artifact_utils")
+def test_upload_if_necessary_only_uploads_once(
+    mocked_artifact_utils,
+    mocked_fileio,
+    mocked_zenml_client,
+):
+    mocked_fileio.exists.return_value = False
+    ea = ExternalArtifact(value=1)
+    artifact_id = ea.upload_if_necessary()
+
+    assert ea.upload_if_necessary() == artifact_id
+    mocked_artifact_utils.upload_artifact.assert_called_once()
+
+
 @pytest.mark.skip
 @patch("zenml.steps.external_artifact.Client")
 def test_upload_if_necessary_by_id(mocked_zenml_client):
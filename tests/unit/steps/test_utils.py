@@ -11,13 +11,15 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Set, Tuple, Union
 
 import pytest
 from numpy import ndarray
 from typing_extensions import Annotated
 
 from zenml.steps.utils import (
+    get_args,
+    is_subclass_annotation,
     parse_return_type_annotations,
     resolve_type_annotation,
 )
@@ -33,6 +35,28 @@ def test_type_annotation_resolving():
     assert resolve_type_annotation(ndarray) is ndarray
 
 
+def test_subclass_annotation_checking():
+    """Tests checking whether annotations resolve to a subclass."""
+    assert is_subclass_annotation(Dict[str, int], dict)
+    assert is_subclass_annotation(Annotated[bool, "output"], int)
+    assert is_subclass_annotation(Annotated[int, {"unhashable": []}], int)
+
+    assert not is_subclass_annotation(List[int], dict)
+    assert not is_subclass_annotation(Any, dict)
+
+
+def test_getting_annotation_args():
+    """Tests getting the args of type annotations."""
+    assert get_args(Union[int, str]) == (int, str)
+    assert get_args(Union[str, int]) == (str, int)
+    assert get_args(Union[List[int], None]) == (list, type(None))
+    assert get_args(Annotated[int, {"unhashable": []}]) == (
+        int,
+        {"unhashable": []},
+    )
+    assert get_args(int) == ()
+
+
 def func_with_no_output_annotation_and_no_return(condition):
     if condition:
         return
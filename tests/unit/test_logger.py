@@ -0,0 +1,28 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import logging
+
+from zenml.logger import LazyLogger
+
+
+def test_lazy_logger_initializes_logger_on_first_use():
+    """Tests that the lazy logger only creates the logger when used."""
+    logger_name = "zenml.test_lazy_logger"
+    lazy_logger = LazyLogger(logger_name)
+    assert lazy_logger._logger is None
+
+    assert lazy_logger.name == logger_name
+    assert lazy_logger._logger is logging.getLogger(logger_name)
+    assert len(lazy_logger.handlers) == 1
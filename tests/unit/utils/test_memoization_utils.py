@@ -0,0 +1,49 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import pytest
+
+from zenml.utils.memoization_utils import lru_cache_if_hashable
+
+
+def test_lru_cache_if_hashable():
+    """Tests that results are only cached for hashable arguments."""
+    calls = []
+
+    @lru_cache_if_hashable(maxsize=16)
+    def func(value):
+        calls.append(value)
+        return len(value)
+
+    assert func((1, 2)) == 2
+    assert func((1, 2)) == 2
+    assert len(calls) == 1
+
+    assert func([1, 2, 3]) == 3
+    assert func([1, 2, 3]) == 3
+    assert len(calls) == 3
+
+
+def test_lru_cache_if_hashable_does_not_swallow_type_errors():
+    """Tests that type errors raised by the function are not caught."""
+
+    @lru_cache_if_hashable()
+    def func(value):
+        raise TypeError("error")
+
+    with pytest.raises(TypeError):
+        func(1)
+
+    with pytest.raises(TypeError):
+        func([1])
@@ -12,6 +12,8 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import gc
+import weakref
 from typing import Dict, Optional
 
 from pydantic import BaseModel
@@ -130,3 +132,53 @@ def test_yaml_serialization_mixin(tmp_path):
     yaml_path.write_text(model.yaml())
 
     assert Model.from_yaml(str(yaml_path)) == model
+
+
+def test_validated_function_is_cached():
+    """Tests that the validated function is reused for the same function."""
+
+    def func(a: int, b: str = "b") -> None:
+        pass
+
+    config = {"arbitrary_types_allowed": True}
+    validated_function = pydantic_utils.get_validated_function(func, config)
+    assert (
+        pydantic_utils.get_validated_function(func, config)
+        is validated_function
+    )
+
+    assert pydantic_utils.validate_function_args(func, config, "1") == {
+        "a": 1,
+        "b": "b",
+    }
+    assert pydantic_utils.validate_function_args(func, config, 2, b="c") == {
+        "a": 2,
+        "b": "c",
+    }
+
+
+def test_validated_function_for_bound_methods_is_shared():
+    """Tests that validated functions of bound methods are shared between
+    instances and don't keep the instances alive."""
+
+    class Class:
+        def method(self, a: int) -> None:
+            pass
+
+    config = {"arbitrary_types_allowed": True}
+    instance = Class()
+    validated_function = pydantic_utils.get_validated_function(
+        instance.method, config
+    )
+    assert (
+        pydantic_utils.get_validated_function(Class().method, config)
+        is validated_function
+    )
+    assert pydantic_utils.validate_function_args(
+        instance.method, config, "1"
+    ) == {"a": 1}
+
+    instance_ref = weakref.ref(instance)
+    del instance
+    gc.collect()
+    assert instance_ref() is None
@@ -184,6 +184,27 @@ def test_basic_source_resolving(mocker):
     )
 
 
+def test_resolved_sources_are_only_cached_for_non_user_objects(mocker):
+    """Tests that only sources which don't depend on the source root or
+    active code repository get cached."""
+    mocker.patch.object(
+        source_utils,
+        "get_source_root",
+        return_value=CURRENT_MODULE_PARENT_DIR,
+    )
+    resolve_spy = mocker.spy(source_utils, "_resolve")
+
+    assert source_utils.resolve(defaultdict) is source_utils.resolve(
+        defaultdict
+    )
+    assert resolve_spy.call_count <= 1
+
+    resolve_spy.reset_mock()
+    source_utils.resolve(EmptyClass)
+    source_utils.resolve(EmptyClass)
+    assert resolve_spy.call_count == 2
+
+
 def test_source_resolving_fails_for_non_toplevel_classes_and_functions(mocker):
     """Tests that source resolving fails for classes and functions that are
     not defined at the module top level."""
@@ -11,3 +11,20 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
+
+from uuid import uuid4
+
+from zenml.utils import yaml_utils
+
+
+def test_is_json_serializable():
+    """Tests checking whether objects are JSON serializable."""
+    assert yaml_utils.is_json_serializable(1)
+    assert yaml_utils.is_json_serializable(None)
+    assert yaml_utils.is_json_serializable(["a", 1.0, True])
+    assert yaml_utils.is_json_serializable({"a": {"b": [1, 2]}})
+    assert yaml_utils.is_json_serializable({"a": uuid4()})
+
+    assert not yaml_utils.is_json_serializable(object())
+    assert not yaml_utils.is_json_serializable([object()])
+    assert not yaml_utils.is_json_serializable({"a": object()})